@@ -3,11 +3,18 @@ Configuration module for Air Quality ETL
 """
 
 import os
-import json
 from pathlib import Path
 from dotenv import load_dotenv
 from typing import Dict, List, Optional
 
+# JSON decoder shared by the ETL modules: orjson when installed, else stdlib
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    import json
+    json_loads = json.loads
+
 # Load environment variables
 load_dotenv()
 
@@ -60,6 +67,7 @@ class Config:
         'pm10.0',
         'pm10.0_cf_1'
     ]
+    PURPLEAIR_FIELDS_CSV = ','.join(PURPLEAIR_FIELDS)
     
     # REMA API Configuration (for future use)
     REMA_API_URL = os.getenv('REMA_API_URL', '')
@@ -78,6 +86,10 @@ class Config:
     # Run environment
     ENVIRONMENT = os.getenv('ENVIRONMENT', 'development')
     
+    # Parsed private sensors, keyed on PA_sensors.json mtime
+    _sensor_cache: Optional[Dict[str, str]] = None
+    _sensor_cache_mtime: Optional[float] = None
+    
     @classmethod
     def get_db_connection_params(cls) -> Dict[str, any]:
         """Get database connection parameters for db_utils"""
@@ -93,21 +105,37 @@ class Config:
     def get_private_sensors(cls) -> Dict[str, str]:
         """
         Get private sensor configuration
-        Can load from either environment variable or sensors.json file
+        Can load from either environment variable or sensors.json file.
+        The result is cached and only re-read when PA_sensors.json changes.
         
         Returns:
             Dictionary mapping sensor_id to read_key
         """
+        # Reuse the parsed result until PA_sensors.json changes on disk
+        sensors_file = cls.PROJECT_ROOT / 'PA_sensors.json'
+        try:
+            mtime = sensors_file.stat().st_mtime
+        except OSError:
+            mtime = None
+        if cls._sensor_cache is not None and cls._sensor_cache_mtime == mtime:
+            return dict(cls._sensor_cache)
+        
+        sensors = cls._load_private_sensors(sensors_file)
+        cls._sensor_cache = sensors
+        cls._sensor_cache_mtime = mtime
+        return dict(sensors)
+    
+    @classmethod
+    def _load_private_sensors(cls, sensors_file: Path) -> Dict[str, str]:
+        """Parse private sensors from PA_sensors.json or the environment"""
         sensors = {}
         
         # First, try to load from PA_sensors.json if it exists
-        sensors_file = cls.PROJECT_ROOT / 'PA_sensors.json'
         if sensors_file.exists():
             try:
-                with open(sensors_file, 'r') as f:
-                    data = json.load(f)
-                    for sensor in data.get('sensors', []):
-                        sensors[sensor['id']] = sensor['read_key']
+                data = json_loads(sensors_file.read_bytes())
+                for sensor in data.get('sensors', []):
+                    sensors[sensor['id']] = sensor['read_key']
                 return sensors
             except Exception as e:
                 print(f"Warning: Could not load PA_sensors.json: {e}")
@@ -137,9 +165,8 @@ class Config:
             errors.append("No sensors configured - set PURPLEAIR_PRIVATE_SENSORS in .env or create PA_sensors.json")
         
         if errors:
-            print("Configuration errors:")
-            for error in errors:
-                print(f"  - {error}")
+            lines = ["Configuration errors:"] + [f"  - {error}" for error in errors]
+            print("\n".join(lines))
             return False
         
         return True
@@ -147,15 +174,18 @@ class Config:
     @classmethod
     def print_config(cls):
         """Print current configuration (hiding sensitive values)"""
-        print("Current Configuration:")
-        print(f"  Environment: {cls.ENVIRONMENT}")
-        print(f"  Database: {cls.DB_HOST}:{cls.DB_PORT}/{cls.DB_NAME}")
-        print(f"  Schema: {cls.DB_SCHEMA}")
-        print(f"  PurpleAir API: {'Configured' if cls.PURPLEAIR_API_KEY else 'Not configured'}")
-        print(f"  Private Sensors: {len(cls.get_private_sensors())} configured")
-        print(f"  REMA API: {'Configured' if cls.REMA_API_URL else 'Not configured'}")
-        print(f"  Save Raw Data: {cls.SAVE_RAW_DATA}")
-        print(f"  Timezone: {cls.TIMEZONE}")
+        lines = [
+            "Current Configuration:",
+            f"  Environment: {cls.ENVIRONMENT}",
+            f"  Database: {cls.DB_HOST}:{cls.DB_PORT}/{cls.DB_NAME}",
+            f"  Schema: {cls.DB_SCHEMA}",
+            f"  PurpleAir API: {'Configured' if cls.PURPLEAIR_API_KEY else 'Not configured'}",
+            f"  Private Sensors: {len(cls.get_private_sensors())} configured",
+            f"  REMA API: {'Configured' if cls.REMA_API_URL else 'Not configured'}",
+            f"  Save Raw Data: {cls.SAVE_RAW_DATA}",
+            f"  Timezone: {cls.TIMEZONE}",
+        ]
+        print("\n".join(lines))
     
     @classmethod
     def check_write_permissions(cls):
@@ -3,62 +3,97 @@
 from __future__ import annotations
 
 from contextlib import contextmanager
-from typing import Generator, Dict, Any, Iterable
+from functools import lru_cache
+from itertools import chain, islice
+from typing import TYPE_CHECKING, Generator, Dict, Any, Iterable, Sequence, Tuple
 
-import pandas as pd
-import psycopg2
-from psycopg2 import extras
+import psycopg
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 
 @contextmanager
-def get_pgsql_cxn(host: str, dbname: str, user: str, password: str, port: int = 5432) -> Generator[psycopg2.extensions.connection, None, None]:
+def get_pgsql_cxn(host: str, dbname: str, user: str, password: str, port: int = 5432) -> Generator[psycopg.Connection, None, None]:
     """Yield a PostgreSQL connection."""
-    conn = psycopg2.connect(host=host, dbname=dbname, user=user, password=password, port=port)
+    conn = psycopg.connect(host=host, dbname=dbname, user=user, password=password, port=port)
     try:
         yield conn
     finally:
         conn.close()
 
 
-def upsert_df(df: pd.DataFrame, schema: str, table_name: str, cxn: psycopg2.extensions.connection, conflict_fields: Iterable[str] | None = None) -> None:
-    """Insert DataFrame rows into a table using ``ON CONFLICT DO NOTHING``.
+@lru_cache(maxsize=64)
+def _build_insert_sql(schema: str, table_name: str, cols: Tuple[str, ...], conflict_fields: Tuple[str, ...]) -> str:
+    """Return the parameterized INSERT statement for a table/column set."""
+
+    columns = ", ".join(cols)
+    placeholders = ", ".join(["%s"] * len(cols))
+    conflict = f"({', '.join(conflict_fields)}) " if conflict_fields else ""
+    return (
+        f"INSERT INTO {schema}.{table_name} ({columns}) "
+        f"VALUES ({placeholders}) ON CONFLICT {conflict}DO NOTHING"
+    )
+
+
+def upsert_rows(rows: Iterable[Sequence[Any]], columns: Sequence[str], schema: str, table_name: str, cxn: psycopg.Connection, conflict_fields: Iterable[str] | None = None, chunk_size: int = 50_000) -> None:
+    """Insert plain row tuples into a table using ``ON CONFLICT DO NOTHING``.
+
+    Rows are sent with ``executemany`` inside a psycopg pipeline, so the
+    statements are streamed to the server without waiting for each result.
 
     Parameters
     ----------
-    df:
-        Data to upsert.
+    rows:
+        Iterable of row sequences, ordered like ``columns``.
+    columns:
+        Target column names.
     schema:
         Target schema name.
     table_name:
         Target table name.
     cxn:
-        Open psycopg2 connection.
+        Open psycopg connection.
     conflict_fields:
         Optional list of column names to determine conflicts. If ``None`` the
         statement simply ignores conflicts.
+    chunk_size:
+        Number of rows committed per transaction.
     """
 
-    if df.empty:
-        return
+    query = _build_insert_sql(
+        schema, table_name, tuple(columns), tuple(conflict_fields or ())
+    )
 
-    cols = list(df.columns)
-    placeholders = ", ".join(["%s"] * len(cols))
-    columns = ", ".join(cols)
-
-    if conflict_fields:
-        conflict = f"({', '.join(conflict_fields)})"
-        query = (
-            f"INSERT INTO {schema}.{table_name} ({columns}) "
-            f"VALUES ({placeholders}) ON CONFLICT {conflict} DO NOTHING"
-        )
-    else:
-        query = (
-            f"INSERT INTO {schema}.{table_name} ({columns}) "
-            f"VALUES ({placeholders}) ON CONFLICT DO NOTHING"
-        )
-
-    values = [tuple(row) for row in df.to_numpy()]
+    rows = iter(rows)
     with cxn.cursor() as cur:
-        extras.execute_batch(cur, query, values)
-    cxn.commit()
+        while True:
+            # Peek one row to detect the end, then stream the rest of the
+            # chunk lazily so executemany never sees a materialized list
+            first = next(rows, None)
+            if first is None:
+                break
+            chunk = chain((first,), islice(rows, chunk_size - 1))
+            with cxn.pipeline():
+                cur.executemany(query, chunk)
+            cxn.commit()
+
+
+def upsert_df(df: pd.DataFrame, schema: str, table_name: str, cxn: psycopg.Connection, conflict_fields: Iterable[str] | None = None, chunk_size: int = 50_000) -> None:
+    """Insert DataFrame rows into a table using ``ON CONFLICT DO NOTHING``.
+
+    Thin wrapper around :func:`upsert_rows`; see it for parameter details.
+    """
+
+    if df.empty:
+        return
 
+    upsert_rows(
+        df.itertuples(index=False, name=None),
+        list(df.columns),
+        schema,
+        table_name,
+        cxn,
+        conflict_fields=conflict_fields,
+        chunk_size=chunk_size,
+    )
@@ -1,11 +1,13 @@
 """ETL package initialization."""
 
 from .extract_purpleair import extract_purpleair_data
-from .transform import transform_purpleair_data
-from .data_quality import validate_dataframe
+from .transform import transform_purpleair_data, transform_purpleair_rows
+from .data_quality import validate_dataframe, validate_rows
 
 __all__ = [
     "extract_purpleair_data",
     "transform_purpleair_data",
+    "transform_purpleair_rows",
     "validate_dataframe",
+    "validate_rows",
 ]
@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
-from typing import Iterable, List
+from typing import TYPE_CHECKING, Any, Iterable, List, Sequence
 
-import pandas as pd
+if TYPE_CHECKING:
+    import pandas as pd
 
 # Columns that must be present and non-null
 REQUIRED_COLUMNS = [
@@ -27,21 +28,60 @@ def validate_dataframe(df: pd.DataFrame) -> List[str]:
     if df.empty:
         return errors
 
-    # Required columns
+    # Required columns (nulls computed for all present columns in one pass)
+    present = [c for c in REQUIRED_COLUMNS if c in df.columns]
+    has_nulls = dict(zip(present, df[present].isna().to_numpy().any(axis=0)))
     for col in REQUIRED_COLUMNS:
         if col not in df.columns:
             errors.append(f"Missing column: {col}")
-        elif df[col].isnull().any():
+        elif has_nulls[col]:
             errors.append(f"Null values found in column: {col}")
 
     # Negative value checks
-    for col in NON_NEGATIVE_COLUMNS:
-        if col in df.columns and (df[col] < 0).any():
-            errors.append(f"Negative values found in column: {col}")
+    numeric = [c for c in NON_NEGATIVE_COLUMNS if c in df.columns]
+    if numeric:
+        negatives = (df[numeric] < 0).to_numpy().any(axis=0)
+        for col, has_negative in zip(numeric, negatives):
+            if has_negative:
+                errors.append(f"Negative values found in column: {col}")
 
     # Duplicate records check
     if "sensor_id" in df.columns and "time_stamp" in df.columns:
-        dupes = df.duplicated(subset=["sensor_id", "time_stamp"]).sum()
+        groups = df.groupby(["sensor_id", "time_stamp"], sort=False, dropna=False).ngroups
+        dupes = len(df) - groups
+        if dupes > 0:
+            errors.append(f"{dupes} duplicate sensor/time_stamp rows")
+
+    return errors
+
+
+def validate_rows(columns: Sequence[str], rows: Sequence[Sequence[Any]]) -> List[str]:
+    """Validate plain ``(columns, rows)`` data, mirroring :func:`validate_dataframe`."""
+    errors: List[str] = []
+
+    if not rows:
+        return errors
+
+    index = {col: i for i, col in enumerate(columns)}
+
+    # Required columns
+    for col in REQUIRED_COLUMNS:
+        if col not in index:
+            errors.append(f"Missing column: {col}")
+        elif any(row[index[col]] is None for row in rows):
+            errors.append(f"Null values found in column: {col}")
+
+    # Negative value checks
+    for col in NON_NEGATIVE_COLUMNS:
+        if col in index:
+            i = index[col]
+            if any(row[i] is not None and row[i] < 0 for row in rows):
+                errors.append(f"Negative values found in column: {col}")
+
+    # Duplicate records check
+    if "sensor_id" in index and "time_stamp" in index:
+        s, t = index["sensor_id"], index["time_stamp"]
+        dupes = len(rows) - len({(row[s], row[t]) for row in rows})
         if dupes > 0:
             errors.append(f"{dupes} duplicate sensor/time_stamp rows")
 
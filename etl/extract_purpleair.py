@@ -2,22 +2,40 @@
 
 from __future__ import annotations
 
-import time
 from typing import Any, Dict, List
 
 import requests
-
-from config import Config
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from config import Config, json_loads
+
+# Shared keep-alive session; urllib3 handles backoff and honours Retry-After
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_maxsize=8,
+        max_retries=Retry(
+            total=5,
+            backoff_factor=0.5,
+            status_forcelist=[429, 502, 503, 504],
+            raise_on_status=False,
+        ),
+    ),
+)
 
 
 def _fetch_multi_sensor(
     sensor_ids: List[int],
     read_keys: List[str],
     fields: str,
-    *,
-    max_retries: int = 5,
-) -> List[Dict[str, Any]]:
-    """Call the PurpleAir multi-sensor endpoint and return parsed rows."""
+) -> Dict[str, Any]:
+    """Call the PurpleAir multi-sensor endpoint.
+
+    Returns the raw ``{"fields": [...], "data": [[...], ...]}`` payload with
+    field names normalized, leaving row construction to the transform step.
+    """
 
     if len(sensor_ids) != len(read_keys):
         raise ValueError("sensor_ids and read_keys must be the same length")
@@ -25,46 +43,27 @@ def _fetch_multi_sensor(
     url = Config.PURPLEAIR_BASE_URL
     headers = {"X-API-Key": Config.PURPLEAIR_API_KEY}
     params = {
-        "show_only": ",".join(str(s) for s in sensor_ids),
+        "show_only": ",".join(map(str, sensor_ids)),
         "read_keys": ",".join(read_keys),
         "fields": fields,
     }
 
-    delay = 0.5
-    last_exc = None
-    for _ in range(max_retries):
-        time.sleep(delay)
-        try:
-            resp = requests.get(
-                url, headers=headers, params=params, timeout=Config.REQUEST_TIMEOUT
-            )
-        except requests.RequestException as exc:
-            last_exc = exc
-            delay *= 2
-            continue
-
-        if resp.status_code == 429:
-            delay *= 2
-            continue
-
-        if resp.status_code >= 400:
-            resp.raise_for_status()
-
-        data = resp.json()
-        field_names = data.get("fields", [])
-        rows = [dict(zip(field_names, row)) for row in data.get("data", [])]
-        return rows
-
-    if last_exc:
-        raise last_exc
-    raise RuntimeError("Failed to fetch PurpleAir data")
-
-
-def extract_purpleair_data() -> List[Dict[str, Any]]:
+    resp = _SESSION.get(
+        url, headers=headers, params=params, timeout=Config.REQUEST_TIMEOUT
+    )
+    resp.raise_for_status()
+
+    data = json_loads(resp.content)
+    # Normalize names once here so downstream steps need not rename
+    field_names = [f.replace(".", "_") for f in data.get("fields", [])]
+    return {"fields": field_names, "data": data.get("data", [])}
+
+
+def extract_purpleair_data() -> Dict[str, Any]:
     """Retrieve sensor data from the PurpleAir API.
 
     The function queries the list of sensors defined in the configuration and
-    returns a list of dictionaries with sensor field values.
+    returns a payload with a ``fields`` list and a ``data`` list of rows.
     """
 
     sensors = Config.get_private_sensors()
@@ -73,12 +72,10 @@ def extract_purpleair_data() -> List[Dict[str, Any]]:
 
     sensor_ids = [int(sid) for sid in sensors.keys()]
     read_keys = list(sensors.values())
-    fields = ",".join(Config.PURPLEAIR_FIELDS)
-
-    return _fetch_multi_sensor(sensor_ids, read_keys, fields)
+    return _fetch_multi_sensor(sensor_ids, read_keys, Config.PURPLEAIR_FIELDS_CSV)
 
 
-def extract_purpleair() -> List[Dict[str, Any]]:
+def extract_purpleair() -> Dict[str, Any]:
     """Backward compatible wrapper."""
     return extract_purpleair_data()
 
@@ -5,32 +5,41 @@ Main ETL orchestrator for Air Quality data pipeline
 import sys
 from pathlib import Path
 import logging
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
+from typing import Optional
 
 # Add parent directory to path for imports
 sys.path.append(str(Path(__file__).parent.parent))
 
-import pandas as pd
-from db_utils import get_pgsql_cxn, upsert_df
+from db_utils import get_pgsql_cxn, upsert_rows
 from config import Config
 
 # Import ETL modules
 from extract_purpleair import extract_purpleair_data
 from extract_rema import extract_rema_data
-from transform import transform_purpleair_data, transform_rema_data
-from data_quality import validate_dataframe
-
-# Set up logging
-logging.basicConfig(
-    level=getattr(logging, Config.LOG_LEVEL),
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(),
-        logging.FileHandler(Config.LOG_DIR / f'etl_{datetime.now().strftime("%Y%m%d")}.log')
-    ]
-)
+from transform import transform_purpleair_rows
+from data_quality import validate_rows
+
 logger = logging.getLogger(__name__)
 
+
+def setup_logging():
+    """Configure console and daily file logging once per process"""
+    root = logging.getLogger()
+    if root.handlers:
+        return
+    
+    logging.basicConfig(
+        level=getattr(logging, Config.LOG_LEVEL),
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        handlers=[
+            logging.StreamHandler(),
+            logging.FileHandler(Config.LOG_DIR / f'etl_{datetime.now().strftime("%Y%m%d")}.log')
+        ]
+    )
+
+
 class AirQualityETL:
     """Main ETL orchestrator for air quality data"""
     
@@ -47,51 +56,75 @@ class AirQualityETL:
             'end_time': None
         }
     
-    def run_purpleair_etl(self):
-        """Run ETL for PurpleAir data"""
+    def run_purpleair_etl(self, extract_future: Optional[Future] = None):
+        """Run ETL for PurpleAir data
+        
+        If ``extract_future`` is given, its result is used as the API payload
+        instead of calling the extractor here.
+        """
         logger.info("Starting PurpleAir ETL...")
         
         try:
             # Extract
-            api_data = extract_purpleair_data()
+            if extract_future is not None:
+                api_data = extract_future.result()
+            else:
+                api_data = extract_purpleair_data()
             
             # Transform
-            df = transform_purpleair_data(api_data)
-            self.stats['purpleair_extracted'] = len(df)
+            columns, rows = transform_purpleair_rows(api_data)
+            self.stats['purpleair_extracted'] = len(rows)
 
             # Data quality validation
-            issues = validate_dataframe(df)
+            issues = validate_rows(columns, rows)
             if issues:
                 for issue in issues:
                     logger.warning(f"Data quality issue: {issue}")
                 self.stats['quality_errors'] += len(issues)
             
-            if df.empty:
+            if not rows:
                 logger.warning("No PurpleAir data to load")
                 return
             
             # Load
             with get_pgsql_cxn(**Config.get_db_connection_params()) as cxn:
-                upsert_df(
-                    df=df,
+                upsert_rows(
+                    rows=rows,
+                    columns=columns,
                     schema=self.schema,
                     table_name='purpleair_readings',
                     cxn=cxn
                 )
-                self.stats['purpleair_loaded'] = len(df)
+                self.stats['purpleair_loaded'] = len(rows)
                 
-            logger.info(f"Loaded {len(df)} PurpleAir readings to {self.schema}.purpleair_readings")
+            logger.info(f"Loaded {len(rows)} PurpleAir readings to {self.schema}.purpleair_readings")
             
         except Exception as e:
             logger.error(f"Error in PurpleAir ETL: {e}", exc_info=True)
             self.stats['errors'] += 1
             raise
     
-    def run_rema_etl(self):
-        """Run ETL for REMA data"""
-        logger.info("REMA ETL skipped - VPN access required")
-        # Will implement when VPN access is available
-        pass
+    def run_rema_etl(self, extract_future: Optional[Future] = None):
+        """Run ETL for REMA data
+        
+        If ``extract_future`` is given, its result is used as the API payload
+        instead of calling the extractor here.
+        """
+        try:
+            # Extract
+            if extract_future is not None:
+                api_data = extract_future.result()
+            else:
+                api_data = extract_rema_data()
+            self.stats['rema_extracted'] = len(api_data)
+            
+            logger.info("REMA load skipped - VPN access required")
+            # Will implement when VPN access is available
+            
+        except Exception as e:
+            logger.error(f"Error in REMA ETL: {e}", exc_info=True)
+            self.stats['errors'] += 1
+            raise
     
     def run_full_etl(self):
         """Run complete ETL for all data sources"""
@@ -101,18 +134,29 @@ class AirQualityETL:
         logger.info(f"Target schema: {self.schema}")
         logger.info("="*60)
         
-        # Run PurpleAir ETL
-        try:
-            if Config.PURPLEAIR_API_KEY:
-                self.run_purpleair_etl()
-            else:
-                logger.warning("PurpleAir API key not configured, skipping")
-        except Exception as e:
-            logger.error(f"PurpleAir ETL failed: {e}")
-        
-        # Run REMA ETL (when available)
-        if Config.REMA_API_URL:
-            self.run_rema_etl()
+        # Both extracts are network-bound and independent, so fetch them
+        # concurrently; transform and load still run one source at a time
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            purpleair_future = (
+                pool.submit(extract_purpleair_data) if Config.PURPLEAIR_API_KEY else None
+            )
+            rema_future = pool.submit(extract_rema_data) if Config.REMA_API_URL else None
+            
+            # Run PurpleAir ETL
+            try:
+                if purpleair_future is not None:
+                    self.run_purpleair_etl(purpleair_future)
+                else:
+                    logger.warning("PurpleAir API key not configured, skipping")
+            except Exception as e:
+                logger.error(f"PurpleAir ETL failed: {e}")
+            
+            # Run REMA ETL (when available)
+            try:
+                if rema_future is not None:
+                    self.run_rema_etl(rema_future)
+            except Exception as e:
+                logger.error(f"REMA ETL failed: {e}")
         
         # Report results
         self.stats['end_time'] = datetime.now()
@@ -134,43 +178,40 @@ class AirQualityETL:
         
         try:
             with get_pgsql_cxn(**Config.get_db_connection_params()) as cxn:
-                # Check PurpleAir data
+                # Summary, negative-value and duplicate checks in one round-trip
                 query = f"""
                     SELECT 
                         COUNT(*) as total_records,
                         COUNT(DISTINCT sensor_id) as unique_sensors,
                         MIN(time_stamp) as oldest_reading,
-                        MAX(time_stamp) as newest_reading
+                        MAX(time_stamp) as newest_reading,
+                        COUNT(*) FILTER (
+                            WHERE pm2_5_atm < 0 OR pm10_0_atm < 0
+                        ) as negative_values,
+                        (
+                            SELECT COUNT(*) FROM (
+                                SELECT 1
+                                FROM {self.schema}.purpleair_readings
+                                GROUP BY sensor_id, time_stamp
+                                HAVING COUNT(*) > 1
+                            ) dups
+                        ) as duplicate_groups
                     FROM {self.schema}.purpleair_readings
                 """
                 
-                df = pd.read_sql(query, cxn)
-                stats = df.iloc[0]
+                with cxn.cursor() as cur:
+                    cur.execute(query)
+                    (total, unique, oldest, newest, neg_count, dup_count) = cur.fetchone()
 
                 logger.info("Database verification:")
-                logger.info(f"  Total records: {stats['total_records']}")
-                logger.info(f"  Unique sensors: {stats['unique_sensors']}")
-                logger.info(f"  Date range: {stats['oldest_reading']} to {stats['newest_reading']}")
+                logger.info(f"  Total records: {total}")
+                logger.info(f"  Unique sensors: {unique}")
+                logger.info(f"  Date range: {oldest} to {newest}")
 
-                # Additional data quality checks
-                neg_query = f"""
-                    SELECT COUNT(*) as negative_values
-                    FROM {self.schema}.purpleair_readings
-                    WHERE pm2_5_atm < 0 OR pm10_0_atm < 0
-                """
-                neg_count = pd.read_sql(neg_query, cxn).iloc[0]['negative_values']
                 if neg_count > 0:
                     logger.warning(f"  {neg_count} readings contain negative values")
-
-                dup_query = f"""
-                    SELECT sensor_id, time_stamp, COUNT(*) as cnt
-                    FROM {self.schema}.purpleair_readings
-                    GROUP BY sensor_id, time_stamp
-                    HAVING COUNT(*) > 1
-                """
-                dup_df = pd.read_sql(dup_query, cxn)
-                if not dup_df.empty:
-                    logger.warning(f"  {len(dup_df)} duplicate sensor/time_stamp rows")
+                if dup_count > 0:
+                    logger.warning(f"  {dup_count} duplicate sensor/time_stamp rows")
                     
         except Exception as e:
             logger.error(f"Error verifying data: {e}")
@@ -178,6 +219,7 @@ class AirQualityETL:
 
 def main():
     """Main entry point"""
+    setup_logging()
     
     # Validate configuration
     if not Config.validate():
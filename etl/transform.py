@@ -2,52 +2,90 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, Iterable, List
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Tuple
 
-import pandas as pd
+if TYPE_CHECKING:
+    import pandas as pd
+
+# PurpleAir field names (after dot normalization) mapped to table columns
+PURPLEAIR_RENAME_MAP = {
+    "sensor_index": "sensor_id",
+    "pm1_0": "pm1_0_atm",
+    "pm2_5": "pm2_5_atm",
+    "pm10_0": "pm10_0_atm",
+}
 
 
 def _normalize_columns(df: pd.DataFrame) -> pd.DataFrame:
-    """Replace dots in column names with underscores."""
-    df = df.copy()
+    """Replace dots in column names with underscores, in place."""
     df.columns = [c.replace(".", "_") for c in df.columns]
     return df
 
 
 def transform_purpleair_data(api_data: Dict[str, Any] | List[Dict[str, Any]]) -> pd.DataFrame:
     """Convert PurpleAir API payload into a normalized DataFrame."""
+    import pandas as pd
 
     if not api_data:
         return pd.DataFrame()
 
     if isinstance(api_data, dict) and "data" in api_data and "fields" in api_data:
-        df = pd.DataFrame(api_data["data"], columns=api_data["fields"])
+        columns = [c.replace(".", "_") for c in api_data["fields"]]
+        df = pd.DataFrame(api_data["data"], columns=columns)
     else:
-        df = pd.DataFrame(api_data)
-
-    df = _normalize_columns(df)
-    
-    rename_map = {
-        "sensor_index": "sensor_id",
-        "pm1_0": "pm1_0_atm",
-        "pm2_5": "pm2_5_atm",
-        "pm10_0": "pm10_0_atm",
-    }
-    df.rename(columns={k: v for k, v in rename_map.items() if k in df.columns}, inplace=True)
+        df = _normalize_columns(pd.DataFrame(api_data))
+
+    df.rename(columns={k: v for k, v in PURPLEAIR_RENAME_MAP.items() if k in df.columns}, inplace=True)
 
     if "last_seen" in df.columns:
-        df["time_stamp"] = pd.to_datetime(df["last_seen"], unit="s", utc=True)
+        df["time_stamp"] = pd.to_datetime(
+            df["last_seen"].to_numpy(), unit="s", utc=True, cache=True
+        )
         df.drop(columns=["last_seen"], inplace=True)
 
     return df
 
 
+def transform_purpleair_rows(payload: Dict[str, Any]) -> Tuple[List[str], List[Tuple[Any, ...]]]:
+    """Convert a PurpleAir ``fields``/``data`` payload into load-ready rows.
+
+    This is the pandas-free counterpart of :func:`transform_purpleair_data`
+    and returns ``(columns, rows)`` with the same column names and a UTC
+    ``time_stamp`` in place of ``last_seen``. Field names are expected to be
+    normalized already, as returned by ``extract_purpleair_data``.
+    """
+
+    if not payload or not payload.get("fields"):
+        return [], []
+
+    columns = [PURPLEAIR_RENAME_MAP.get(f, f) for f in payload["fields"]]
+
+    if "last_seen" not in columns:
+        return columns, [tuple(row) for row in payload.get("data", [])]
+
+    ts_idx = columns.index("last_seen")
+    keep = [i for i in range(len(columns)) if i != ts_idx]
+    rows = []
+    for row in payload.get("data", []):
+        last_seen = row[ts_idx]
+        time_stamp = (
+            datetime.fromtimestamp(last_seen, tz=timezone.utc)
+            if last_seen is not None
+            else None
+        )
+        rows.append(tuple(row[i] for i in keep) + (time_stamp,))
+
+    return [columns[i] for i in keep] + ["time_stamp"], rows
+
+
 def transform_rema_data(api_data: Iterable[Dict[str, Any]]) -> pd.DataFrame:
     """Convert REMA API payload into a DataFrame.
 
     The exact structure of the REMA API is currently unknown, so this function
     performs minimal processing and simply returns ``pd.DataFrame(api_data)``.
     """
+    import pandas as pd
 
     if not api_data:
         return pd.DataFrame()